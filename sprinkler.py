@@ -16,26 +16,42 @@ bhyve API reference (community-documented):
               2. send {"event":"set_rain_delay","device_id":"...","delay":0,"timestamp":"..."}
               3. send {"event":"set_manual_preset_runtime","device_id":"...",
                        "stations":[{"station":<n>,"run_time":<min>}],"timestamp":"..."}
-  Dep       : websocket-client (pip)
+  Deps      : aiohttp, orjson, uvloop (pip)
 """
 
-import json
+import asyncio
+import collections
+import gzip
+import html
 import logging
 import logging.handlers
 import os
+import queue
 import signal
+import ssl
+import string
 import sys
 import threading
 import time
-import urllib.error
-import urllib.request
-from datetime import datetime, timezone
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from datetime import datetime
 
-import websocket  # websocket-client package
+import aiohttp
+import orjson
+import uvloop
+from aiohttp import web
+from aiohttp.abc import AbstractAccessLogger
 
 log = logging.getLogger("sprinkler")
 
+# ─── Helpers ──────────────────────────────────────────────────────────────────
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ``YYYY-MM-DDTHH:MM:SSZ``, without strftime."""
+    t = time.gmtime()
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z")
+
+
 # ─── Configuration ────────────────────────────────────────────────────────────
 
 class Config:
@@ -47,6 +63,7 @@ class Config:
         self.run_time         = int(os.environ.get("RUN_TIME", "5"))
         self.trigger_key      = os.environ.get("TRIGGER_KEY", "animal")
         self.webhook_port     = int(os.environ.get("WEBHOOK_PORT", "8383"))
+        self.debounce_seconds = float(os.environ.get("DEBOUNCE_SECONDS", "10"))
         self.log_level        = os.environ.get("LOG_LEVEL", "INFO").upper()
         self.log_file         = os.environ.get("LOG_FILE", "/data/activity.log")
 
@@ -69,91 +86,131 @@ class APIError(Exception):
     pass
 
 
+class AuthError(APIError):
+    """bhyve closed the WebSocket before accepting our session token."""
+
+
 class BhyveClient:
     BASE_URL = "https://api.orbitbhyve.com/v1"
     WS_URL   = "wss://api.orbitbhyve.com/v1/events"
     APP_ID   = "dad3e38c-9af4-4960-aa76-9e51e8ba5c2c"
     TIMEOUT  = 15
+    # Prebuilt headers for the unauthenticated /session calls
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+    _APP_HEADERS  = {**_JSON_HEADERS, "orbit-app-id": APP_ID}
 
     def __init__(self, config: Config):
         self.config          = config
         self._api_key        = None   # orbit_api_key  — used for REST calls
         self._session_token  = None   # orbit_session_token — used for WS auth
-        self._lock           = threading.Lock()
+        self._session        = None   # aiohttp.ClientSession, created by open()
+        self._login_lock     = None   # asyncio.Lock, created by open()
+        # Credentials never change, so serialize the login body once
+        self._creds = orjson.dumps(
+            {"session": {"email": config.bhyve_email, "password": config.bhyve_password}}
+        )
+
+    # ── session lifecycle ─────────────────────────────────────────────────────
+
+    async def open(self):
+        """Create the shared HTTP session; must run on the event loop."""
+        # Created here so the lock binds to the running loop (Python 3.9)
+        self._login_lock = asyncio.Lock()
+        # One TLS context for every connection: the CA store is loaded once,
+        # and TLS 1.2+ without compression is enforced for the bhyve API.
+        ssl_ctx = ssl.create_default_context()
+        ssl_ctx.minimum_version = ssl.TLSVersion.TLSv1_2
+        ssl_ctx.options |= ssl.OP_NO_COMPRESSION
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.TIMEOUT),
+            connector=aiohttp.TCPConnector(
+                ssl=ssl_ctx,
+                limit=10,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,          # reconnects skip the DNS lookup
+                happy_eyeballs_delay=0.1,   # race IPv4/IPv6 instead of waiting
+            ),
+        )
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     # ── REST helpers ──────────────────────────────────────────────────────────
 
-    def _request(self, method: str, path: str, body=None, *, auth: bool = False):
-        url  = f"{self.BASE_URL}{path}"
-        data = json.dumps(body).encode() if body is not None else None
-        headers = {
-            "Content-Type": "application/json",
-            "orbit-app-id": self.APP_ID,
-        }
-        if auth and self._api_key:
-            headers["orbit-api-key"] = self._api_key
-
-        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    async def _request(self, method: str, path: str, body=None, *, data: bytes = None,
+                       auth: bool = False, app_id: bool = True):
+        """Send ``body`` as JSON, or ``data`` if it is already serialized."""
+        url = f"{self.BASE_URL}{path}"
+        if data is None and body is not None:
+            data = orjson.dumps(body)
+        if not app_id:
+            headers = self._JSON_HEADERS
+        elif auth and self._api_key:
+            headers = {**self._APP_HEADERS, "orbit-api-key": self._api_key}
+        else:
+            headers = self._APP_HEADERS
+
         try:
-            with urllib.request.urlopen(req, timeout=self.TIMEOUT) as resp:
-                raw = resp.read().decode()
-                return json.loads(raw) if raw.strip() else {}
-        except urllib.error.HTTPError as exc:
-            body_txt = exc.read().decode()
-            raise APIError(f"HTTP {exc.code} {method} {path}: {body_txt}") from exc
-        except urllib.error.URLError as exc:
-            raise APIError(f"Network error {method} {path}: {exc.reason}") from exc
+            async with self._session.request(method, url, data=data, headers=headers) as resp:
+                raw = await resp.read()
+                if resp.status >= 400:
+                    raise APIError(f"HTTP {resp.status} {method} {path}: "
+                                   f"{raw.decode(errors='replace')}")
+                return orjson.loads(raw) if raw.strip() else {}
+        except aiohttp.ClientError as exc:
+            raise APIError(f"Network error {method} {path}: {exc}") from exc
+        except asyncio.TimeoutError as exc:
+            raise APIError(f"Network error {method} {path}: timed out") from exc
 
     # ── REST auth ─────────────────────────────────────────────────────────────
 
-    def login(self):
+    async def login(self):
         """
         Authenticate and cache both tokens:
           - orbit_api_key      (login WITH orbit-app-id header) → REST calls
           - orbit_session_token (login WITHOUT orbit-app-id header) → WS auth
         """
-        creds = {"session": {"email": self.config.bhyve_email, "password": self.config.bhyve_password}}
-
         # REST token (needs orbit-app-id header)
         log.debug("Logging in to bhyve (REST) as %s", self.config.bhyve_email)
-        resp_api = self._request("POST", "/session", creds)
+        resp_api = await self._request("POST", "/session", data=self._creds)
         api_key = resp_api.get("orbit_api_key")
         if not api_key:
             raise APIError(f"No orbit_api_key in login response: {resp_api}")
 
         # WS session token (login WITHOUT orbit-app-id header — returns orbit_session_token)
         log.debug("Logging in to bhyve (WS session) as %s", self.config.bhyve_email)
-        resp_sess = self._request_no_appid("POST", "/session", creds)
+        resp_sess = await self._request("POST", "/session", data=self._creds, app_id=False)
         session_token = resp_sess.get("orbit_session_token")
         if not session_token:
             raise APIError(f"No orbit_session_token in session login response: {resp_sess}")
 
-        with self._lock:
-            self._api_key       = api_key
-            self._session_token = session_token
+        self._api_key       = api_key
+        self._session_token = session_token
         log.info("bhyve login successful (user_id=%s)", resp_api.get("user_id", "?"))
 
-    def _request_no_appid(self, method: str, path: str, body=None):
-        """REST request without orbit-app-id header — used to obtain orbit_session_token."""
-        url  = f"{self.BASE_URL}{path}"
-        data = json.dumps(body).encode() if body is not None else None
-        req  = urllib.request.Request(
-            url, data=data,
-            headers={"Content-Type": "application/json"},
-            method=method,
-        )
-        try:
-            with urllib.request.urlopen(req, timeout=self.TIMEOUT) as resp:
-                raw = resp.read().decode()
-                return json.loads(raw) if raw.strip() else {}
-        except urllib.error.HTTPError as exc:
-            raise APIError(f"HTTP {exc.code} {method} {path}: {exc.read().decode()}") from exc
-        except urllib.error.URLError as exc:
-            raise APIError(f"Network error {method} {path}: {exc.reason}") from exc
+    async def _ensure_logged_in(self) -> str:
+        """Return a session token, logging in once even if many callers race."""
+        if not self._session_token:
+            async with self._login_lock:
+                if not self._session_token:
+                    await self.login()
+        return self._session_token
+
+    async def _refresh_login(self, stale_token: str):
+        """
+        Re-login after ``stale_token`` was rejected.  Only the first caller
+        whose token still matches does the POST; the rest reuse its result.
+        """
+        async with self._login_lock:
+            if self._session_token is stale_token or self._session_token is None:
+                self._session_token = None
+                await self.login()
 
     # ── Zone control ──────────────────────────────────────────────────────────
 
-    def start_zone(self, zone: int, run_time: int):
+    async def start_zone(self, zone: int, run_time: int):
         """
         Open a fresh WebSocket connection, authenticate, send a manual-run
         command, and wait for confirmation.  The connection is transient —
@@ -163,82 +220,100 @@ class BhyveClient:
         :param zone:     Station number (1-based)
         :param run_time: Duration in minutes
         """
-        with self._lock:
-            session_token = self._session_token
-        if not session_token:
-            raise APIError("Not logged in — call login() first")
-
-        device_id  = self.config.bhyve_device_id
-        done      = threading.Event()
-        auth_done = threading.Event()
-        outcome   = {}
-
-        def on_open(ws):
-            log.debug("WS connected, sending auth")
-            # Use orbit_session_token (from login without app-id) — correct WS auth format
-            ws.send(json.dumps({
-                "event":               "app_connection",
-                "orbit_session_token": session_token,
-            }))
-            # Wait for change_mode auth ack (up to 10s) before sending run command
-            def _send_run():
-                if not auth_done.wait(timeout=10):
-                    log.debug("WS: no change_mode within 10s, sending run anyway")
-                ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-                ws.send(json.dumps({
-                    "event":     "change_mode",
-                    "mode":      "manual",
-                    "device_id": device_id,
-                    "timestamp": ts,
-                    "stations":  [{"station": zone, "run_time": run_time}],
-                }))
-                log.debug("WS → manual run sent (zone=%d, run_time=%d)", zone, run_time)
-            threading.Thread(target=_send_run, daemon=True).start()
-
-        def on_message(ws, raw):
-            log.debug("WS raw ← %r", raw[:300] if raw else raw)
-            if not raw:
-                return
-            try:
-                msg = json.loads(raw)
-            except Exception as exc:
-                log.debug("WS non-JSON: %s", exc)
-                return
-            event = msg.get("event", "")
-            log.debug("WS ← %s | %s", event, json.dumps(msg)[:200])
-            if event == "change_mode":
-                log.debug("WS authenticated (change_mode received)")
-                auth_done.set()
-            elif event in ("watering_in_progress", "watering_in_progress_notification", "rain_delay"):
-                outcome["event"] = event
-                outcome["msg"]   = msg
-                done.set()
-                ws.close()
-
-        def on_error(ws, error):
-            log.warning("WS error: %s", error)
-
-        def on_close(ws, code, msg):
-            log.debug("WS closed (code=%s)", code)
-            done.set()  # unblock wait if server closes before confirmation
-
-        wsa = websocket.WebSocketApp(
-            self.WS_URL,
-            on_open    = on_open,
-            on_message = on_message,
-            on_error   = on_error,
-            on_close   = on_close,
-        )
-        threading.Thread(target=wsa.run_forever, daemon=True).start()
-
-        if not done.wait(timeout=40):
-            wsa.close()
-            log.warning("WS: no confirmation within 40s — command was sent but outcome unknown")
-            return
+        session_token = await self._ensure_logged_in()
+        try:
+            await self._run_zone(session_token, zone, run_time)
+        except AuthError:
+            # The run command is only sent after auth, so retrying is safe
+            log.info("bhyve session token rejected — logging in again")
+            await self._refresh_login(session_token)
+            await self._run_zone(self._session_token, zone, run_time)
+
+    async def _run_zone(self, session_token: str, zone: int, run_time: int):
+        device_id = self.config.bhyve_device_id
+        loop      = asyncio.get_running_loop()
+        deadline  = loop.time() + 40
+        auth_by   = loop.time() + 10
+        run_sent  = False
+        outcome   = None
+
+        async def _send_run(ws):
+            ts = _utc_timestamp()
+            await ws.send_str(orjson.dumps({
+                "event":     "change_mode",
+                "mode":      "manual",
+                "device_id": device_id,
+                "timestamp": ts,
+                "stations":  [{"station": zone, "run_time": run_time}],
+            }).decode())
+            log.debug("WS → manual run sent (zone=%d, run_time=%d)", zone, run_time)
 
-        event = outcome.get("event", "")
+        try:
+            async with self._session.ws_connect(self.WS_URL) as ws:
+                log.debug("WS connected, sending auth")
+                # Use orbit_session_token (from login without app-id) — correct WS auth format
+                await ws.send_str(orjson.dumps({
+                    "event":               "app_connection",
+                    "orbit_session_token": session_token,
+                }).decode())
+
+                while outcome is None:
+                    now = loop.time()
+                    # Wait for change_mode auth ack (up to 10s) before sending run command
+                    if not run_sent and now >= auth_by:
+                        log.debug("WS: no change_mode within 10s, sending run anyway")
+                        await _send_run(ws)
+                        run_sent = True
+                    if now >= deadline:
+                        log.warning("WS: no confirmation within 40s — command was sent but outcome unknown")
+                        return
+                    wait_until = deadline if run_sent else auth_by
+                    try:
+                        frame = await ws.receive(timeout=wait_until - now)
+                    except asyncio.TimeoutError:
+                        continue
+
+                    if frame.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING,
+                                      aiohttp.WSMsgType.CLOSED):
+                        log.debug("WS closed (code=%s)", ws.close_code)
+                        if not run_sent:
+                            raise AuthError(f"WebSocket closed before auth (code={ws.close_code})")
+                        break
+                    if frame.type == aiohttp.WSMsgType.ERROR:
+                        log.warning("WS error: %s", ws.exception())
+                        break
+                    if frame.type != aiohttp.WSMsgType.TEXT:
+                        continue
+
+                    raw = frame.data
+                    log.debug("WS raw ← %r", raw[:300] if raw else raw)
+                    if not raw:
+                        continue
+                    try:
+                        msg = orjson.loads(raw)
+                    except Exception as exc:
+                        log.debug("WS non-JSON: %s", exc)
+                        continue
+                    if not isinstance(msg, dict):
+                        log.debug("WS non-object JSON: %r", msg)
+                        continue
+                    event = msg.get("event", "")
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("WS ← %s | %s", event, orjson.dumps(msg)[:200].decode(errors="replace"))
+                    if event == "change_mode":
+                        log.debug("WS authenticated (change_mode received)")
+                        if not run_sent:
+                            await _send_run(ws)
+                            run_sent = True
+                    elif event in ("watering_in_progress", "watering_in_progress_notification", "rain_delay"):
+                        outcome = (event, msg)
+        except aiohttp.ClientError as exc:
+            raise APIError(f"WebSocket error: {exc}") from exc
+        except asyncio.TimeoutError as exc:
+            raise APIError("WebSocket error: connect timed out") from exc
+
+        event, msg = outcome or ("", {})
         if event == "rain_delay":
-            msg     = outcome.get("msg", {})
             delay_h = msg.get("delay", "?")
             cause   = msg.get("rain_delay_weather_type", "unknown")
             raise APIError(
@@ -253,71 +328,112 @@ class BhyveClient:
 
 # ─── Sprinkler Controller ─────────────────────────────────────────────────────
 
+ControllerState = collections.namedtuple(
+    "ControllerState", ["status", "last_triggered", "last_zone", "last_run_time"]
+)
+
+
 class SprinklerController:
     MAX_LOG = 20
+    # Longest a trigger is held off by an activation that never finishes:
+    # WS connect (15 s) + confirmation wait (40 s) + margin
+    ACTIVATING_LOCKOUT = 75
 
     def __init__(self, config: Config, client: BhyveClient):
         self.config       = config
         self.client       = client
-        self._lock        = threading.Lock()
-        self.status       = "idle"   # idle | activating | running | error
-        self.last_zone    = None
-        self.last_run_time = None
-        self.last_triggered = None
-        self.activity_log = []       # [(timestamp_str, message), ...]
+        # Readers never lock: state and log_snapshot are immutable tuples that
+        # writers rebuild under _write_lock and publish with a single rebind.
+        self._write_lock  = threading.Lock()
+        self.state        = ControllerState("idle", None, None, None)  # idle | activating | running | error
+        self.activity_log = collections.deque(maxlen=self.MAX_LOG)  # [(ts, level, message, li_html), ...]
+        self.log_snapshot = ()       # tuple(activity_log), republished on write
+        self.log_version  = 0        # bumped on every activity_log change
+        self._activation_started = 0.0  # time.monotonic() when the last activation began
+        self._run_started = 0.0      # time.monotonic() when the last run was confirmed
+
+    def _set_state(self, **changes):
+        with self._write_lock:
+            self.state = self.state._replace(**changes)
 
     def _add_activity(self, message: str, level: str = "info"):
-        ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        with self._lock:
-            self.activity_log.insert(0, (ts, level, message))
-            if len(self.activity_log) > self.MAX_LOG:
-                self.activity_log = self.activity_log[:self.MAX_LOG]
+        ts = _utc_timestamp()
+        # Render the status-page row once here rather than on every page load
+        css = "log-error" if level == "error" else ("log-warning" if level == "warning" else "log-msg")
+        fragment = (
+            f'<li><time class="log-ts" data-utc="{ts}">{ts}</time>'
+            f'<span class="{css}">{html.escape(message)}</span></li>'
+        ).encode()
+        with self._write_lock:
+            self.activity_log.appendleft((ts, level, message, fragment))
+            self.log_snapshot = tuple(self.activity_log)
+            self.log_version += 1
         getattr(log, level, log.info)(message)
 
-    def activate_zone(self, zone: int = None, run_time: int = None):
-        """Activate a zone (uses config defaults if not specified)."""
+    async def activate_zone(self, zone: int = None, run_time: int = None, *,
+                            debounce: bool = True):
+        """
+        Activate a zone (uses config defaults if not specified).
+
+        With ``debounce``, a trigger for the same zone as the last activation
+        is dropped while that activation is still in progress (for at most
+        ACTIVATING_LOCKOUT seconds), or within DEBOUNCE_SECONDS of its run
+        being confirmed.  Triggers for a different zone always proceed.
+        Dropped triggers are logged but kept out of the activity log.
+        """
         zone     = zone     if zone     is not None else self.config.zone_number
         run_time = run_time if run_time is not None else self.config.run_time
 
-        with self._lock:
-            self.status        = "activating"
-            self.last_zone     = zone
-            self.last_run_time = run_time
-            self.last_triggered = datetime.now().isoformat()
-
+        state = self.state
+        if debounce and zone == state.last_zone:
+            status = state.status
+            now    = time.monotonic()
+            if (status == "activating"
+                    and now - self._activation_started < self.ACTIVATING_LOCKOUT) or (
+                    status == "running"
+                    and now - self._run_started < self.config.debounce_seconds):
+                log.info("Debounced duplicate trigger for zone %d (%s)", zone, status)
+                return True
+
+        self._activation_started = time.monotonic()
+        self._set_state(
+            status="activating",
+            last_triggered=datetime.now().isoformat(),
+            last_zone=zone,
+            last_run_time=run_time,
+        )
         self._add_activity(f"Activating zone {zone} for {run_time} minute(s)")
 
         try:
-            self.client.start_zone(zone, run_time)
-            with self._lock:
-                self.status = "running"
+            await self.client.start_zone(zone, run_time)
+            self._run_started = time.monotonic()
+            self._set_state(status="running")
             self._add_activity(f"Zone {zone} is running for {run_time} minute(s)")
 
             # Reset status after runtime elapses
-            def _reset():
-                time.sleep(run_time * 60)
-                with self._lock:
-                    if self.status == "running":
-                        self.status = "idle"
-                self._add_activity(f"Zone {zone} run complete")
-
-            threading.Thread(target=_reset, daemon=True).start()
+            asyncio.get_running_loop().call_later(run_time * 60, self._finish_run, zone)
             return True
 
         except APIError as exc:
-            with self._lock:
-                self.status = "error"
+            self._set_state(status="error")
+            self._add_activity(f"Error activating zone {zone}: {exc}", level="error")
+            return False
+
+        except Exception as exc:
+            # Never leave the controller stuck in "activating"
+            log.exception("Unexpected error activating zone %d", zone)
+            self._set_state(status="error")
             self._add_activity(f"Error activating zone {zone}: {exc}", level="error")
             return False
 
+    def _finish_run(self, zone: int):
+        with self._write_lock:
+            if self.state.status == "running":
+                self.state = self.state._replace(status="idle")
+        self._add_activity(f"Zone {zone} run complete")
+
     def get_state(self) -> dict:
-        with self._lock:
-            return {
-                "status":        self.status,
-                "last_triggered": self.last_triggered,
-                "last_zone":     self.last_zone,
-                "last_run_time": self.last_run_time,
-            }
+        return self.state._asdict()
 
 
 # ─── Status Page HTML ─────────────────────────────────────────────────────────
@@ -529,167 +645,259 @@ _STATUS_HTML = """\
 """
 
 
-# ─── HTTP Request Handler ─────────────────────────────────────────────────────
-
-class WebhookHandler(BaseHTTPRequestHandler):
-    controller: SprinklerController = None
-    config: Config = None
+def _compile_template(template: str):
+    """
+    Split a str.format-style template into encoded literal segments and the
+    field names between them, so rendering is a join instead of a re-parse.
+    """
+    parts, fields, pending = [], [], []
+    for literal, field, _spec, _conv in string.Formatter().parse(template):
+        pending.append(literal)   # "{{" / "}}" arrive as field-less chunks
+        if field is not None:
+            parts.append("".join(pending).encode())
+            fields.append(field)
+            pending = []
+    parts.append("".join(pending).encode())
+    return parts, fields
+
+
+def _encode_value(value) -> bytes:
+    return value if isinstance(value, bytes) else str(value).encode()
+
+
+def _bind_template(template, constants: dict):
+    """
+    Fold fields whose values never change into the surrounding literal
+    segments, leaving a compiled template with only the dynamic fields.
+    """
+    parts, fields = template
+    bound_parts, bound_fields = [parts[0]], []
+    for field, part in zip(fields, parts[1:]):
+        if field in constants:
+            bound_parts[-1] += _encode_value(constants[field]) + part
+        else:
+            bound_fields.append(field)
+            bound_parts.append(part)
+    return bound_parts, bound_fields
+
+
+def _render_template(template, values: dict) -> bytes:
+    parts, fields = template
+    out = []
+    add = out.append
+    for part, field in zip(parts, fields):
+        add(part)
+        add(_encode_value(values[field]))
+    add(parts[-1])
+    return b"".join(out)
+
+
+_STATUS_TEMPLATE = _compile_template(_STATUS_HTML)
+
+
+# ─── HTTP Server ──────────────────────────────────────────────────────────────
+
+class _AccessLogger(AbstractAccessLogger):
+    def log(self, request, response, time):
+        log.debug("HTTP %s — %s %s %d", request.remote, request.method,
+                  request.path_qs, response.status)
+
+
+class WebhookServer:
+    HTML_CACHE_TTL    = 1.0   # seconds; upper bound on status page staleness
+    KEEPALIVE_TIMEOUT = 75    # seconds an idle keep-alive connection is held
+    _HEALTH_OK        = b'{"status":"ok"}'
+
+    def __init__(self, config: Config, controller: SprinklerController):
+        self.config     = config
+        self.controller = controller
+        self._tasks     = set()   # strong refs to fire-and-forget activations
+        self._html_cache = None   # (key, rendered_at, body_bytes, gzipped_bytes)
+        self._trigger_key = config.trigger_key.casefold()
+        # Config is fixed for the process lifetime, so substitute it once
+        self._status_template = _bind_template(_STATUS_TEMPLATE, dict(
+            port=config.webhook_port,
+            device_id=html.escape(config.bhyve_device_id),
+            default_zone=config.zone_number,
+            default_run_time=config.run_time,
+            trigger_key=html.escape(config.trigger_key),
+        ))
 
-    def log_message(self, fmt, *args):
-        log.debug("HTTP %s — " + fmt, self.address_string(), *args)
+    def build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._not_found])
+        app.router.add_get("/",        self.status)
+        app.router.add_get("/status",  self.status)
+        app.router.add_get("/health",  self.health)
+        app.router.add_post("/webhook", self.webhook)
+        app.router.add_post("/test",    self.test)
+        return app
 
     # ── response helpers ──────────────────────────────────────────────────────
 
-    def _json(self, code: int, body: dict):
-        data = json.dumps(body).encode()
-        self.send_response(code)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(data)))
-        self.end_headers()
-        self.wfile.write(data)
-
-    def _html(self, html: str):
-        data = html.encode()
-        self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(data)))
-        self.end_headers()
-        self.wfile.write(data)
-
-    def _read_body(self) -> dict:
-        length = int(self.headers.get("Content-Length", 0))
-        if length == 0:
+    @staticmethod
+    def _send_raw(code: int, ctype: str, body: bytes, headers: dict = None) -> web.Response:
+        """
+        Respond with a fully pre-encoded body.  The length is known up front,
+        so aiohttp emits status line, headers and body in a single write.
+        """
+        hdrs = {"Content-Type": ctype}
+        if headers:
+            hdrs.update(headers)
+        return web.Response(status=code, body=body, headers=hdrs)
+
+    def _json(self, code: int, body: dict) -> web.Response:
+        return self._send_raw(code, "application/json", orjson.dumps(body))
+
+    @staticmethod
+    def _accepts_gzip(request: web.Request) -> bool:
+        """True if Accept-Encoding lists gzip with a non-zero q-value."""
+        for coding in request.headers.get("Accept-Encoding", "").split(","):
+            name, _, params = coding.partition(";")
+            if name.strip().lower() != "gzip":
+                continue
+            q = 1.0
+            for param in params.split(";"):
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "q":
+                    try:
+                        q = float(value)
+                    except ValueError:
+                        q = 0.0
+            return q > 0
+        return False
+
+    @staticmethod
+    async def _read_body(request: web.Request) -> dict:
+        raw = await request.read()
+        if not raw:
             return {}
-        return json.loads(self.rfile.read(length).decode())
+        return orjson.loads(raw)
 
-    # ── routes ────────────────────────────────────────────────────────────────
-
-    def do_GET(self):
-        if self.path in ("/", "/status"):
-            self._serve_status()
-        elif self.path == "/health":
-            self._json(200, {"status": "ok", **self.controller.get_state()})
-        else:
-            self._json(404, {"error": "not found"})
-
-    def do_POST(self):
-        if self.path == "/webhook":
-            self._handle_webhook()
-        elif self.path == "/test":
-            self._handle_test()
-        else:
-            self._json(404, {"error": "not found"})
+    @web.middleware
+    async def _not_found(self, request: web.Request, handler):
+        # Unknown paths and wrong methods both get the JSON 404 body
+        try:
+            return await handler(request)
+        except (web.HTTPNotFound, web.HTTPMethodNotAllowed):
+            return self._json(404, {"error": "not found"})
 
     # ── status page ───────────────────────────────────────────────────────────
 
-    def _serve_status(self):
-        state = self.controller.get_state()
-        status = state["status"]
+    async def status(self, request: web.Request) -> web.Response:
+        state = self.controller.state
+        # Everything dynamic on the page derives from state + the activity log,
+        # so an unchanged key means the previous render is still exact.
+        key = (state, self.controller.log_version)
+        now = time.monotonic()
+        cached = self._html_cache
+        if not (cached and cached[0] == key and now - cached[1] < self.HTML_CACHE_TTL):
+            body = self._render_status(state)
+            cached = (key, now, body, gzip.compress(body, compresslevel=6))
+            self._html_cache = cached
+
+        if self._accepts_gzip(request):
+            return self._send_raw(200, "text/html; charset=utf-8", cached[3],
+                                  {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+        return self._send_raw(200, "text/html; charset=utf-8", cached[2],
+                              {"Vary": "Accept-Encoding"})
+
+    def _render_status(self, state: ControllerState) -> bytes:
+        status = state.status
         badge = {"idle": "idle", "activating": "activating",
                  "running": "running", "error": "error"}.get(status, "idle")
 
-        logs = self.controller.activity_log
+        logs = self.controller.log_snapshot
         if logs:
-            rows = []
-            for entry in logs:
-                ts, level, msg = entry if len(entry) == 3 else (entry[0], "info", entry[1])
-                css = "log-error" if level == "error" else ("log-warning" if level == "warning" else "log-msg")
-                rows.append(
-                    f'<li><time class="log-ts" data-utc="{ts}">{ts}</time>'
-                    f'<span class="{css}">{msg}</span></li>'
-                )
-            items = "\n      ".join(rows)
+            items = b"\n      ".join(entry[3] for entry in logs)
         else:
-            items = '<li><span class="empty">No activity yet</span></li>'
+            items = b'<li><span class="empty">No activity yet</span></li>'
 
-        html = _STATUS_HTML.format(
-            port=self.config.webhook_port,
+        return _render_template(self._status_template, dict(
             status=status.upper(),
             status_class=badge,
-            device_id=self.config.bhyve_device_id,
-            default_zone=self.config.zone_number,
-            default_run_time=self.config.run_time,
-            trigger_key=self.config.trigger_key,
-            last_triggered=state["last_triggered"] or "Never",
-            last_zone=str(state["last_zone"]) if state["last_zone"] is not None else "—",
-            last_run_time=f"{state['last_run_time']} min" if state["last_run_time"] else "—",
+            last_triggered=state.last_triggered or "Never",
+            last_zone=str(state.last_zone) if state.last_zone is not None else "—",
+            last_run_time=f"{state.last_run_time} min" if state.last_run_time else "—",
             activity_items=items,
-        )
-        self._html(html)
+        ))
+
+    async def health(self, request: web.Request) -> web.Response:
+        # Liveness probes get a constant body; ?detail=1 adds controller state
+        if request.query.get("detail") != "1":
+            return self._send_raw(200, "application/json", self._HEALTH_OK)
+        return self._json(200, {"status": "ok", **self.controller.get_state()})
 
     # ── webhook handler ───────────────────────────────────────────────────────
 
-    def _handle_webhook(self):
-        length = int(self.headers.get("Content-Length", 0))
-        raw = self.rfile.read(length) if length else b""
+    async def webhook(self, request: web.Request) -> web.Response:
+        raw = await request.read()
         log.debug("Webhook raw body (%d bytes): %s", len(raw), raw[:500])
 
         try:
-            data = json.loads(raw.decode()) if raw else {}
-        except (json.JSONDecodeError, ValueError) as exc:
+            data = orjson.loads(raw) if raw else {}
+        except (orjson.JSONDecodeError, ValueError) as exc:
             log.warning("Bad webhook payload: %s", exc)
-            self._json(400, {"error": "invalid JSON"})
-            return
+            return self._json(400, {"error": "invalid JSON"})
 
         # If UP wraps payload in an outer JSON string, unwrap it
         if isinstance(data, str):
             try:
-                data = json.loads(data)
-            except (json.JSONDecodeError, ValueError):
+                data = orjson.loads(data)
+            except (orjson.JSONDecodeError, ValueError):
                 pass
 
         if not isinstance(data, dict):
             log.warning("Webhook payload is not a JSON object: %r", data)
-            self._json(400, {"error": "expected JSON object"})
-            return
+            return self._json(400, {"error": "expected JSON object"})
 
-        log.debug("Webhook parsed: %s", json.dumps(data))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Webhook parsed: %s", orjson.dumps(data).decode())
 
-        # Match trigger key in alarm.triggers[].key
+        # Match trigger key in alarm.triggers[].key (case-insensitive)
         alarm = data.get("alarm") or data.get("Alarm") or {}
-        triggers = []
+        triggers = ()
         if isinstance(alarm, dict):
-            triggers = alarm.get("triggers") or alarm.get("Triggers") or []
-
-        matched = any(
-            t.get("key") == self.config.trigger_key or
-            t.get("Key") == self.config.trigger_key
-            for t in triggers
-            if isinstance(t, dict)
-        )
-
-        if matched:
-            # Allow payload to override the default zone number
-            zone = None
-            raw_zone = data.get("zone") or data.get("Zone")
-            if raw_zone is not None:
-                try:
-                    zone = int(raw_zone)
-                    if not (1 <= zone <= 12):
-                        zone = None
-                except (TypeError, ValueError):
-                    zone = None
-            log.info("Webhook trigger matched: key=%s, zone=%s",
-                     self.config.trigger_key, zone or self.config.zone_number)
-            threading.Thread(
-                target=self.controller.activate_zone,
-                kwargs={"zone": zone},
-                daemon=True,
-            ).start()
-            self._json(200, {"triggered": True})
-        else:
+            triggers = alarm.get("triggers") or alarm.get("Triggers") or ()
+
+        matched = False
+        for t in triggers:
+            if not isinstance(t, dict):
+                continue
+            k = t.get("key") or t.get("Key")
+            if isinstance(k, str) and k.casefold() == self._trigger_key:
+                matched = True
+                break
+
+        if not matched:
             log.debug("Webhook received but trigger key '%s' not matched",
                       self.config.trigger_key)
-            self._json(200, {"triggered": False})
+            return self._json(200, {"triggered": False})
+
+        # Allow payload to override the default zone number
+        zone = None
+        raw_zone = data.get("zone") or data.get("Zone")
+        if raw_zone is not None:
+            try:
+                zone = int(raw_zone)
+                if not (1 <= zone <= 12):
+                    zone = None
+            except (TypeError, ValueError):
+                zone = None
+        log.info("Webhook trigger matched: key=%s, zone=%s",
+                 self.config.trigger_key, zone or self.config.zone_number)
+        # Respond immediately; the activation continues in the background
+        task = asyncio.ensure_future(self.controller.activate_zone(zone=zone))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return self._json(200, {"triggered": True})
 
     # ── test handler ──────────────────────────────────────────────────────────
 
-    def _handle_test(self):
+    async def test(self, request: web.Request) -> web.Response:
         try:
-            data = self._read_body()
-        except (json.JSONDecodeError, ValueError):
-            self._json(400, {"error": "invalid JSON"})
-            return
+            data = await self._read_body(request)
+        except (orjson.JSONDecodeError, ValueError):
+            return self._json(400, {"error": "invalid JSON"})
 
         try:
             zone     = int(data.get("zone", self.config.zone_number))
@@ -699,24 +907,66 @@ class WebhookHandler(BaseHTTPRequestHandler):
             if not (1 <= run_time <= 60):
                 raise ValueError("run_time must be 1–60")
         except (TypeError, ValueError) as exc:
-            self._json(400, {"error": str(exc)})
-            return
+            return self._json(400, {"error": str(exc)})
 
         log.info("Test activation requested: zone=%d, run_time=%d min", zone, run_time)
-        # Run synchronously so the response reflects actual success or failure
-        ok = self.controller.activate_zone(zone=zone, run_time=run_time)
+        # Await the activation so the response reflects actual success or failure
+        ok = await self.controller.activate_zone(zone=zone, run_time=run_time, debounce=False)
         if ok:
-            self._json(200, {"activated": True, "zone": zone, "run_time": run_time})
-        else:
-            # Pull the most recent activity log entry for a useful error message
-            with self.controller._lock:
-                entry = self.controller.activity_log[0] if self.controller.activity_log else None
-                last = entry[2] if entry and len(entry) == 3 else "Unknown error"
-            self._json(500, {"activated": False, "error": last})
+            return self._json(200, {"activated": True, "zone": zone, "run_time": run_time})
+
+        # Pull the most recent activity log entry for a useful error message
+        logs  = self.controller.log_snapshot
+        entry = logs[0] if logs else None
+        last  = entry[2] if entry else "Unknown error"
+        return self._json(500, {"activated": False, "error": last})
 
 
 # ─── Entry Point ──────────────────────────────────────────────────────────────
 
+async def _serve(config: Config, client: BhyveClient, controller: SprinklerController):
+    await client.open()
+    try:
+        # Login at startup to validate credentials
+        try:
+            await client.login()
+        except APIError as exc:
+            log.error("bhyve login failed: %s", exc)
+            sys.exit(1)
+        await _run_server(config, controller)
+    finally:
+        await client.close()
+
+
+async def _run_server(config: Config, controller: SprinklerController):
+    server = WebhookServer(config, controller)
+    # HTTP/1.1 keep-alive and TCP_NODELAY are aiohttp defaults; pin the idle
+    # timeout so a browser's 15 s auto-refresh reuses its socket without
+    # idle connections lingering for the hour newer aiohttp releases allow.
+    runner = web.AppRunner(server.build_app(), access_log_class=_AccessLogger,
+                           keepalive_timeout=WebhookServer.KEEPALIVE_TIMEOUT)
+    await runner.setup()
+    site = web.TCPSite(runner, "0.0.0.0", config.webhook_port)
+    await site.start()
+    log.info("Listening on port %d", config.webhook_port)
+    log.info("Status page → http://0.0.0.0:%d/", config.webhook_port)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def _shutdown(sig):
+        log.info("Shutting down (signal %d)…", sig)
+        stop.set()
+
+    loop.add_signal_handler(signal.SIGINT,  _shutdown, signal.SIGINT)
+    loop.add_signal_handler(signal.SIGTERM, _shutdown, signal.SIGTERM)
+
+    try:
+        await stop.wait()
+    finally:
+        await runner.cleanup()
+
+
 def main():
     config = Config()
 
@@ -737,6 +987,15 @@ def main():
         ))
         logging.getLogger().addHandler(fh)
 
+    # Hand records to one background thread so console and log-file writes
+    # (including rotation) never block the event loop serving requests.
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *root.handlers,
+                                              respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+
     log.info("Starting Unifi Protect → bhyve sprinkler controller")
     log.info("Device: %s | Zone: %d | Run time: %d min | Trigger key: %s",
              config.bhyve_device_id, config.zone_number,
@@ -745,32 +1004,11 @@ def main():
     client     = BhyveClient(config)
     controller = SprinklerController(config, client)
 
-    # Login at startup to validate credentials
-    try:
-        client.login()
-    except APIError as exc:
-        log.error("bhyve login failed: %s", exc)
-        sys.exit(1)
-
-    WebhookHandler.controller = controller
-    WebhookHandler.config     = config
-
-    server = HTTPServer(("0.0.0.0", config.webhook_port), WebhookHandler)
-    log.info("Listening on port %d", config.webhook_port)
-    log.info("Status page → http://0.0.0.0:%d/", config.webhook_port)
-
-    def _shutdown(sig, _frame):
-        log.info("Shutting down (signal %d)…", sig)
-        threading.Thread(target=server.shutdown, daemon=True).start()
-        sys.exit(0)
-
-    signal.signal(signal.SIGINT,  _shutdown)
-    signal.signal(signal.SIGTERM, _shutdown)
-
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
-        server.serve_forever()
-    except SystemExit:
-        pass
+        asyncio.run(_serve(config, client, controller))
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":